@@ -1,39 +1,106 @@
 import geojson
 import os
 import json
-from shapely.geometry import mapping, MultiPolygon, MultiLineString, Polygon, Point
+import copy
+import hashlib
+import pickle
+import tempfile
+from shapely.geometry import mapping, MultiPolygon, MultiLineString
 from shapely.geometry.base import BaseGeometry
-from shapely.ops import unary_union
 from itertools import combinations
+from functools import cached_property, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pyogrio
+import shapely
+
+try:
+    import orjson  # Optional, faster JSON parsing and serialization
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow  # Optional, lets pyogrio read through the GDAL Arrow interface
+except ImportError:
+    pyarrow = None
+
+# Results of unchanged inputs are reused across runs from this directory;
+# set "cache_results": false in global_settings to turn the cache off
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'topologytest')
+# Oldest cached results beyond this many files are removed
+CACHE_MAX_ENTRIES = 64
+
+@lru_cache(maxsize=None)
+def _load_json(path, mtime):
+    """
+    Parse a JSON file, cached per path and modification time.
+    :param path: Absolute path to the JSON file.
+    :param mtime: Modification time of the file, so edits invalidate the cache.
+    :return: The parsed JSON data, shared by all callers; copy it before handing it out.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    return orjson.loads(data) if orjson else json.loads(data)
 
 class TopologyTest:
-    def __init__(self, geojson_file, dataset_type, config_file):
+    def __init__(self, geojson_file, dataset_type, config_file=None, config=None):
         """
         Initialize the TopologyTest with a GeoJSON file and config file.
         :param geojson_file: Path to the GeoJSON file to validate.
         :param dataset_type: The type of dataset, e.g., 'roads' or 'buildings'.
         :param config_file: Path to the config file containing all settings and rules.
+        :param config: Already parsed config dictionary, used instead of config_file.
         """
         self.geojson_file = geojson_file
         self.dataset_type = dataset_type
-        self.config = self._load_config(config_file)
-        self.rules = self._load_rules(config_file)
-        self.geometries = self._load_geometries(geojson_file)
+        # Parse the config file once; settings and rules are both derived from it.
+        # Each instance gets its own copy, so changes never leak into other instances
+        full_config = copy.deepcopy(config if config is not None else self._read_config(config_file))
+        self.config = self._load_config(full_config)
+        self.rules = self._load_rules(full_config)
+        # Geometry array and attribute columns shared by all checks
+        self._geom_arr, self._attr_cols, self.crs = self._load_geometries(geojson_file)
+        # Prepared geometries let every predicate pass take the GEOS fast path
+        shapely.prepare(self._geom_arr)
+        # Index arrays of the invalid intersections, filled on first check
         self.invalid_intersections = None
+        # Intersection geometries keyed by (index1, index2) feature pairs
+        self._pair_intersections = {}
 
-    def _load_config(self, config_file):
+    @cached_property
+    def _tree(self):
+        """Spatial index over all geometries, built once on first use."""
+        return shapely.STRtree(self._geom_arr)
+
+    @cached_property
+    def _bounds(self):
+        """Bounding boxes of all geometries as an (N, 4) array, computed once."""
+        return shapely.bounds(self._geom_arr)
+
+    def _read_config(self, config_file):
+        """
+        Read and parse the JSON config file.
+        :param config_file: Path to the config file.
+        :return: Dictionary containing the full parsed config, shared through the parse cache.
         """
-        Load configuration parameters from a JSON file.
-        :param config_file: Path to the JSON file.
+        if not config_file or not os.path.exists(config_file):
+            raise FileNotFoundError(f"Config file not found: {config_file}")
+
+        config_path = os.path.abspath(config_file)
+        return _load_json(config_path, os.path.getmtime(config_path))
+
+    def _load_config(self, full_config):
+        """
+        Load configuration parameters from the parsed config.
+        :param full_config: Dictionary containing the full parsed config.
         :return: Dictionary containing configuration parameters.
         """
-        if config_file and os.path.exists(config_file):
-            with open(config_file) as f:
-                full_config = json.load(f)
-                
+        if full_config:
             # Merge global settings with dataset-specific rules
-            config = full_config.get('global_settings', {})
+            config = dict(full_config.get('global_settings', {}))
             dataset_rules = full_config.get('dataset_rules', {}).get(self.dataset_type, {})
             
             # Combine settings
@@ -80,10 +147,10 @@ class TopologyTest:
         """
         Load geometries and attributes from a GeoJSON file.
         :param geojson_file: Path to the GeoJSON file.
-        :return: A list of tuples, each containing a shapely geometry and its attributes.
+        :return: A tuple of (geometry array, dictionary of attribute column arrays, CRS).
         """
-        # Load the GeoJSON using geopandas
-        gdf = gpd.read_file(geojson_file)
+        # Read all features in bulk through pyogrio, via Arrow when it is installed
+        gdf = pyogrio.read_dataframe(geojson_file, use_arrow=pyarrow is not None)
 
         # Ensure CRS is WGS84
         if gdf.crs is None:
@@ -92,32 +159,33 @@ class TopologyTest:
         else:
             pass  # Removed duplicate logging
 
-        # Extract geometries and attributes
-        geometries = []
-        for _, row in gdf.iterrows():
-            geom = row['geometry']
-            # Adjust based on how attributes are stored
-            if 'properties' in row and isinstance(row['properties'], dict):
-                attributes = row['properties']
-            else:
-                attributes = row.to_dict()
-            geometries.append((geom, attributes))
+        # Extract geometries and attribute columns without iterating rows;
+        # object columns keep values as plain Python scalars
+        geometries = np.asarray(gdf.geometry.values, dtype=object)
+        attributes = {col: gdf[col].to_numpy(dtype=object)
+                      for col in gdf.columns if col != gdf.geometry.name}
 
-        return geometries
+        return geometries, attributes, gdf.crs
 
-    def _load_rules(self, config_file):
+    def _attributes(self, idx):
         """
-        Load rules from the config file.
-        :param config_file: Path to the config file.
-        :return: A dictionary containing rules for the dataset type.
+        Build the attribute dictionary of a single feature.
+        :param idx: Index of the feature.
+        :return: Dictionary of attribute names and values.
         """
-        if not os.path.exists(config_file):
-            raise FileNotFoundError(f"Config file not found: {config_file}")
-
-        with open(config_file) as f:
-            config = json.load(f)
+        # Adjust based on how attributes are stored
+        properties = self._attr_cols.get('properties')
+        if properties is not None and isinstance(properties[idx], dict):
+            return properties[idx]
+        return {col: values[idx] for col, values in self._attr_cols.items()}
 
-        dataset_rules = config.get('dataset_rules', {}).get(self.dataset_type)
+    def _load_rules(self, full_config):
+        """
+        Load rules from the parsed config.
+        :param full_config: Dictionary containing the full parsed config.
+        :return: A dictionary containing rules for the dataset type.
+        """
+        dataset_rules = full_config.get('dataset_rules', {}).get(self.dataset_type)
         if not dataset_rules:
             raise ValueError(f"Dataset type '{self.dataset_type}' not found in config.")
 
@@ -129,75 +197,201 @@ class TopologyTest:
         :return: A list of invalid intersection tuples containing:
                 (geometry1, geometry2, intersection_geometry, attributes1, attributes2)
         """
-        if self.invalid_intersections is not None:
-            return self.invalid_intersections  # Return cached results
-
-        invalid_intersections = []
-        gdf = gpd.GeoDataFrame(self.geometries, columns=['geometry', 'attributes'])
-        sindex = gdf.sindex  # Spatial index
-
-        for idx, row in gdf.iterrows():
-            possible_matches_index = list(sindex.intersection(row['geometry'].bounds))
-            possible_matches = gdf.iloc[possible_matches_index]
-
-            for _, match in possible_matches.iterrows():
-                if idx >= match.name:
-                    continue  # Avoid duplicate checks and self-comparison
-
-                if row['geometry'].intersects(match['geometry']):
-                    if not self._is_valid_intersection(row['attributes'], match['attributes']):
-                        try:
-                            inter_geom = row['geometry'].intersection(match['geometry'])
-                            # Check if the intersection geometry is valid
-                            if not inter_geom.is_valid:
-                                continue
-                            if inter_geom.area >= self.config.get("min_intersection_area", 0):
-                                # Debug print
-                                print(f"Found intersection: {type(row['geometry'])}")
-                                
-                                # Convert all geometries to GeoJSON format
-                                geom1_json = mapping(row['geometry'])
-                                geom2_json = mapping(match['geometry'])
-                                inter_geom_json = mapping(inter_geom)
-                                
-                                invalid_intersections.append((
-                                    geom1_json,
-                                    geom2_json,
-                                    inter_geom_json,
-                                    row['attributes'],
-                                    match['attributes']
-                                ))
-                        except Exception as e:
-                            print(f"Error processing intersection: {str(e)}")
-                            continue
-
-        self.invalid_intersections = invalid_intersections  # Cache the results
-        return invalid_intersections
-
-    def _is_valid_intersection(self, attr1, attr2):
-        """
-        Check if the intersection between two features is valid based on rules.
-        :param attr1: Attributes of the first feature.
-        :param attr2: Attributes of the second feature.
-        :return: True if the intersection is valid, False otherwise.
-        """
-        conditions = self.rules.get("allow_intersection_if", [])
-
-        # If no conditions are specified, no intersections are allowed
-        if not conditions:
-            return False
-
-        # Check each condition; if any condition is met, the intersection is valid
-        for condition in conditions:
-            attribute = condition.get("attribute")
-            allowed_values = condition.get("values", [])
-
-            # Check if either feature meets the condition
-            if attr1.get(attribute) in allowed_values or attr2.get(attribute) in allowed_values:
-                return True
-
-        # If no conditions are met, the intersection is invalid
-        return False
+        if self.invalid_intersections is None:
+            self.invalid_intersections = self._find_invalid_intersections()  # Cache the results
+
+        # Issue tuples are only built from the cached index arrays when asked for
+        left, right, inter_geoms = self.invalid_intersections
+        geoms = self._geom_arr
+        return [(geoms[idx1], geoms[idx2], inter_geom,
+                 self._attributes(idx1), self._attributes(idx2))
+                for idx1, idx2, inter_geom in zip(left, right, inter_geoms)]
+
+    def _find_invalid_intersections(self):
+        """
+        Find the feature pairs whose intersection breaks the dataset rules.
+        :return: A tuple of (index1 array, index2 array, intersection geometry array).
+        """
+        # Reuse results from an earlier run on the same file and rules
+        cache_file = self._cache_file('intersections')
+        if cache_file:
+            try:
+                with open(cache_file, 'rb') as f:
+                    left, right, inter_geoms = pickle.load(f)
+                return left, right, inter_geoms
+            except Exception:
+                pass  # Missing, corrupt or written by other library versions
+
+        geoms = self._geom_arr
+
+        # All intersecting pairs, each pair only once
+        left, right = self._candidate_pairs
+
+        # Drop pairs allowed by the dataset rules before computing any overlay
+        invalid = ~self._is_valid_intersection(left, right)
+        left, right = left[invalid], right[invalid]
+
+        inter_geoms = self._pairwise_intersection(left, right)
+        # Check if the intersection geometry is valid and large enough
+        keep = shapely.is_valid(inter_geoms) & (
+            shapely.area(inter_geoms) >= self.config.get("min_intersection_area", 0))
+        left, right, inter_geoms = left[keep], right[keep], inter_geoms[keep]
+
+        for idx1 in left:
+            # Debug print
+            print(f"Found intersection: {type(geoms[idx1])}")
+
+        if cache_file:
+            self._write_cache(cache_file, (left, right, inter_geoms))
+        return left, right, inter_geoms
+
+    def _cache_file(self, check_type):
+        """
+        Path of the on-disk result cache for a check on the current inputs.
+        :param check_type: Name of the check whose results are cached.
+        :return: Path to the pickle file, keyed by file, size, mtime and rules,
+                 or None if caching is disabled or the input is not a local file.
+        """
+        if not self.config.get('cache_results', True):
+            return None
+
+        geojson_path = os.path.abspath(self.geojson_file)
+        try:
+            stat = os.stat(geojson_path)
+        except OSError:
+            return None  # E.g. GDAL virtual paths such as /vsizip/ or URLs
+
+        settings = json.dumps([self.rules, self.config.get('min_intersection_area', 0)],
+                              sort_keys=True, default=str)
+        key = hashlib.blake2b(
+            f"v3:{check_type}:{geojson_path}:{stat.st_size}:{stat.st_mtime_ns}:{settings}".encode(),
+            digest_size=16).hexdigest()
+        return os.path.join(CACHE_DIR, f"{key}.pkl")
+
+    def _write_cache(self, cache_file, results):
+        """
+        Store check results in the on-disk cache; failures only skip caching.
+        :param cache_file: Path returned by _cache_file.
+        :param results: Check results to pickle.
+        """
+        tmp_name = None
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial pickle
+            with tempfile.NamedTemporaryFile('wb', dir=CACHE_DIR, suffix='.tmp',
+                                             delete=False) as f:
+                tmp_name = f.name
+                pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_file)
+        except Exception as e:
+            print(f"Could not cache {os.path.basename(cache_file)}: {e}")
+            if tmp_name and os.path.exists(tmp_name):
+                os.remove(tmp_name)  # Never leave partial pickles behind
+            return
+
+        self._prune_cache()
+
+    def _prune_cache(self):
+        """Remove the oldest cached results beyond CACHE_MAX_ENTRIES files."""
+        # Other processes may write or prune the cache at the same time,
+        # so files can disappear between listing and removing them
+        entries = []
+        try:
+            for entry in os.scandir(CACHE_DIR):
+                if entry.name.endswith('.pkl'):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except FileNotFoundError:
+                        pass
+        except OSError:
+            return
+
+        for _, path in sorted(entries, reverse=True)[CACHE_MAX_ENTRIES:]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Could not remove cached results {os.path.basename(path)}: {e}")
+
+    def _pairwise_intersection(self, left, right):
+        """
+        Compute the intersection of each pair of features with vectorized calls,
+        split into chunks that run in parallel threads. Results are memoized per
+        pair, so checks that share pairs (intersections and overlaps) only
+        compute each intersection once.
+        :param left: Array of indices of the first feature in each pair.
+        :param right: Array of indices of the second feature in each pair, with left < right.
+        :return: Array of intersection geometries.
+        """
+        pairs = list(zip(left.tolist(), right.tolist()))
+        inter_geoms = np.empty(len(pairs), dtype=object)
+        inter_geoms[:] = [self._pair_intersections.get(pair) for pair in pairs]
+
+        missing = np.flatnonzero(shapely.is_missing(inter_geoms))
+        if len(missing) == 0:
+            return inter_geoms
+
+        # GEOS releases the GIL, so chunks of pairs intersect in parallel threads
+        chunks = np.array_split(missing, min(os.cpu_count() or 1, len(missing)))
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            computed = np.concatenate(list(executor.map(
+                self._intersect_chunk,
+                [self._geom_arr[left[chunk]] for chunk in chunks],
+                [self._geom_arr[right[chunk]] for chunk in chunks])))
+
+        inter_geoms[missing] = computed
+        self._pair_intersections.update(zip((pairs[i] for i in missing), computed))
+        return inter_geoms
+
+    def _intersect_chunk(self, geoms1, geoms2):
+        """
+        Intersect two equally long geometry arrays element-wise in one vectorized call.
+        Falls back to pair-by-pair computation if GEOS fails on the batch, leaving
+        None for the pairs that cannot be computed.
+        :param geoms1: Array of shapely geometries.
+        :param geoms2: Array of shapely geometries, same length as geoms1.
+        :return: Array of intersection geometries.
+        """
+        try:
+            return shapely.intersection(geoms1, geoms2)
+        except shapely.errors.GEOSException:
+            inter_geoms = np.empty(len(geoms1), dtype=object)
+            for i, (geom1, geom2) in enumerate(zip(geoms1, geoms2)):
+                try:
+                    inter_geoms[i] = geom1.intersection(geom2)
+                except Exception as e:
+                    print(f"Error processing intersection: {str(e)}")
+            return inter_geoms
+
+    @cached_property
+    def _feature_allowed(self):
+        """
+        Per-feature flags marking features that meet any allow_intersection_if
+        condition on their own; such features make all their intersections valid.
+        :return: Boolean array with one entry per feature.
+        """
+        allowed = np.zeros(len(self._geom_arr), dtype=bool)
+
+        # If no conditions are specified, no intersections are allowed;
+        # Series.isin hashes the allowed values instead of comparing each one
+        for condition in self.rules.get("allow_intersection_if", []):
+            column = self._attr_cols.get(condition.get("attribute"))
+            if column is None:
+                continue
+            allowed |= pd.Series(column, copy=False).isin(condition.get("values", [])).to_numpy()
+
+        return allowed
+
+    def _is_valid_intersection(self, left, right):
+        """
+        Check which intersections between pairs of features are valid based on rules.
+        :param left: Array of indices of the first feature in each pair.
+        :param right: Array of indices of the second feature in each pair.
+        :return: Boolean array, True where the intersection is valid.
+        """
+        # Any condition met by either feature makes the intersection valid
+        return self._feature_allowed[left] | self._feature_allowed[right]
 
     def save_topology_results(self, results):
         """Save all topology check results to GeoJSON files."""
@@ -228,132 +422,268 @@ class TopologyTest:
             return f"No invalid intersections found in dataset: {self.dataset_type}."
 
         # Save the invalid intersections to a new GeoJSON file
-        output_file = self.save_invalid_intersections(invalid_intersections)
+        output_file = self._save_issues_to_geojson('intersections', invalid_intersections)
 
         # Generate a report
-        report = f"Invalid intersections found in dataset: {self.dataset_type}\n"
-        report += f"Number of invalid intersections: {len(invalid_intersections)}\n"
-        report += f"Invalid intersections have been saved to: {output_file}\n"
-        return report
+        lines = [
+            f"Invalid intersections found in dataset: {self.dataset_type}",
+            f"Number of invalid intersections: {len(invalid_intersections)}",
+            f"Invalid intersections have been saved to: {output_file}"
+        ]
+        return "\n".join(lines) + "\n"
     
     def check_self_intersections(self):
         '''Check if any individual geometry intersects with itself.'''
-        self_intersections = []
-        for geom, attrs in self.geometries:
-            if not geom.is_simple:
-                self_intersections.append((geom, attrs))
-        return self_intersections
+        # Null geometries are skipped; is_simple reports them as not simple
+        not_simple = shapely.is_geometry(self._geom_arr) & ~shapely.is_simple(self._geom_arr)
+        return [(self._geom_arr[idx], self._attributes(idx)) for idx in np.flatnonzero(not_simple)]
 
     def check_gaps(self, tolerance=0.0):
         """
-        Check for gaps between adjacent polygons.
-        :param tolerance: Maximum allowed gap width
+        Check for gaps between adjacent polygons narrower than twice the tolerance.
+        Enclosed gaps are holes between polygons that would close completely once
+        the polygons are buffered by the tolerance; open gaps are slits and notches
+        along the edge of the layer that close the same way.
+        :param tolerance: Buffer distance that closes a gap; gaps up to 2 * tolerance wide are reported
         :return: A Shapely geometry representing gaps, or None if no gaps found
         """
-        if not self.geometries:
+        # No buffer closes a gap at zero tolerance, so there is nothing to report
+        if len(self._geom_arr) == 0 or tolerance <= 0:
             return None
         
         # Extract only polygon geometries
-        polygons = [geom for geom, _ in self.geometries if isinstance(geom, Polygon)]
-        if not polygons:
+        poly_idx = np.flatnonzero(
+            shapely.get_type_id(self._geom_arr) == shapely.GeometryType.POLYGON)
+        if len(poly_idx) == 0:
             return None
             
         try:
-            # Create a union of all polygons
-            all_polys = unary_union(polygons)
-            # Create a slightly larger boundary
-            buffered = all_polys.buffer(tolerance)
-            # Find gaps
-            gaps = buffered.difference(all_polys)
-            
+            polygons = self._geom_arr[poly_idx]
+
+            # Node all polygon boundaries and polygonize them; every face is
+            # either covered by an input polygon or enclosed by them (a gap)
+            linework = shapely.union_all(shapely.boundary(polygons))
+            faces = shapely.get_parts(shapely.polygonize(shapely.get_parts(linework)))
+
+            # Faces whose interior point lies within no input polygon are enclosed gaps
+            face_idx, geom_idx = self._tree.query(
+                shapely.point_on_surface(faces), predicate="within")
+            covered = np.zeros(len(faces), dtype=bool)
+            covered[face_idx[np.isin(geom_idx, poly_idx)]] = True
+            enclosed = faces[~covered]
+
+            # Only enclosed gaps narrow enough to close within the tolerance are reported
+            gaps = enclosed[shapely.is_empty(shapely.buffer(enclosed, -tolerance))]
+
+            # Open gaps are not enclosed by any linework; closing the layer (buffer
+            # out, then back in) fills those narrower than 2 * tolerance
+            union = shapely.union_all(polygons)
+            closed = shapely.buffer(shapely.buffer(union, tolerance, join_style="mitre"),
+                                    -tolerance, join_style="mitre")
+            filled = shapely.get_parts(shapely.difference(closed, union))
+
+            # Parts inside an enclosed face belong to the enclosed pass above
+            in_face, _ = shapely.STRtree(enclosed).query(
+                shapely.point_on_surface(filled), predicate="within")
+            open_gaps = np.delete(filled, in_face)
+
+            # The buffer round trip never returns the input exactly; drop the
+            # floating-point slivers it leaves along edges, which are far thinner
+            # than any gap the tolerance is meant to catch
+            widths = 2 * shapely.area(open_gaps) / np.maximum(shapely.length(open_gaps), 1e-300)
+            open_gaps = open_gaps[widths > tolerance * 1e-6]
+
+            gaps = np.concatenate([gaps, open_gaps])
+
             # Return None if no gaps found
-            if gaps.is_empty:
+            if len(gaps) == 0:
                 return None
                 
-            return gaps
+            return shapely.union_all(gaps)
         except Exception as e:
             print(f"Error checking for gaps: {str(e)}")
             return None
     
-    def check_dangles(self):
-        """Check for dangling ends in line networks."""
-        dangles = []
-        # Create network from all lines
-        network = unary_union([geom for geom, _ in self.geometries])
-        
-        for geom, attrs in self.geometries:
-            if geom.geom_type == 'LineString':
-                start_point = Point(geom.coords[0])
-                end_point = Point(geom.coords[-1])
-                # Check if endpoints connect to other lines
-                if not network.difference(geom).intersects(start_point) or \
-                not network.difference(geom).intersects(end_point):
-                    dangles.append((geom, attrs))
-        return dangles
+    def check_dangles(self, tolerance=0.0):
+        """
+        Check for dangling ends in line networks.
+        :param tolerance: Distance within which line ends are considered connected
+        """
+        # Only non-empty LineStrings have a start and an end point
+        line_idx = np.flatnonzero(
+            (shapely.get_type_id(self._geom_arr) == shapely.GeometryType.LINESTRING)
+            & ~shapely.is_empty(self._geom_arr))
+        lines = self._geom_arr[line_idx]
+
+        # All start points followed by all end points as one coordinate array
+        owners = np.concatenate([line_idx, line_idx])
+        endpoints = shapely.get_coordinates(
+            np.concatenate([shapely.get_point(lines, 0), shapely.get_point(lines, -1)]))
+
+        # Quantize coordinates so endpoints within tolerance fall together,
+        # then count how many distinct lines meet at each endpoint; a closed
+        # ring's start and end do not connect it to itself
+        keys = np.round(endpoints / tolerance) if tolerance > 0 else endpoints
+        _, key_ids = np.unique(keys, axis=0, return_inverse=True)
+        key_ids = key_ids.reshape(-1)
+        line_ends = np.unique(np.column_stack([key_ids, owners]), axis=0)
+        counts = np.bincount(line_ends[:, 0], minlength=len(key_ids))
+
+        # Endpoints shared with another line are connected; the rest
+        # may still end on another feature's interior (e.g. a T-junction)
+        loose = counts[key_ids] == 1
+        owners = owners[loose]
+        points = shapely.points(endpoints[loose])
+        point_idx, geom_idx = self._tree.query(points, predicate="dwithin", distance=tolerance)
+
+        connected = np.zeros(len(points), dtype=bool)
+        connected[point_idx[geom_idx != owners[point_idx]]] = True
+
+        return [(self._geom_arr[idx], self._attributes(idx))
+                for idx in np.unique(owners[~connected])]
     
+    def _grid_tiles(self):
+        """
+        Partition the features into a coarse uniform grid of about sqrt(N) tiles.
+        Each feature belongs to the tile holding the centre of its bounding box.
+        :return: A list of feature index arrays, one per non-empty tile.
+        """
+        # Null and empty geometries have NaN bounds and intersect nothing, so they are left out
+        idx = np.flatnonzero(shapely.is_geometry(self._geom_arr) & ~shapely.is_empty(self._geom_arr))
+        if len(idx) == 0:
+            return []
+
+        bounds = self._bounds[idx]
+        centres = (bounds[:, :2] + bounds[:, 2:]) / 2
+        minx, miny = bounds[:, :2].min(axis=0)
+        maxx, maxy = bounds[:, 2:].max(axis=0)
+        tiles_per_side = int(np.ceil(len(idx) ** 0.25))
+
+        # Grid cell of every bounding box centre, clipped onto the outer edge
+        extent = np.array([maxx - minx, maxy - miny])
+        extent[extent == 0] = 1
+        cells = ((centres - [minx, miny]) / extent * tiles_per_side).astype(int)
+        cells = np.clip(cells, 0, tiles_per_side - 1)
+        tile_ids = cells[:, 1] * tiles_per_side + cells[:, 0]
+
+        order = np.argsort(tile_ids, kind="stable")
+        return np.split(idx[order], np.flatnonzero(np.diff(tile_ids[order])) + 1)
+
+    def _tile_pairs(self, tile):
+        """
+        Find intersecting pairs whose first feature lies in the given tile.
+        :param tile: Array of feature indices belonging to the tile.
+        :return: A tuple of (left, right) index arrays of intersecting pairs.
+        """
+        # Each pair only once, with the lower index on the left
+        left, right = self._tree.query(self._geom_arr[tile], predicate="intersects")
+        left = tile[left]
+        keep = left < right
+        return left[keep], right[keep]
+
+    @cached_property
+    def _candidate_pairs(self):
+        """
+        All intersecting feature pairs, shared by the intersection, overlap and
+        containment checks since overlapping and containing both imply intersecting.
+        :return: A tuple of (left, right) index arrays with left < right, sorted.
+        """
+        # Tiles keep each batch of tree queries spatially local and are independent,
+        # so they run in threads; every pair is found in exactly one tile
+        tiles = self._grid_tiles()
+        with ThreadPoolExecutor() as executor:
+            tile_pairs = list(executor.map(self._tile_pairs, tiles))
+
+        left = np.concatenate([pairs[0] for pairs in tile_pairs] + [np.empty(0, dtype=np.intp)])
+        right = np.concatenate([pairs[1] for pairs in tile_pairs] + [np.empty(0, dtype=np.intp)])
+        order = np.lexsort((right, left))
+        return left[order], right[order]
+
     def check_overlaps(self, tolerance=0.0):
         """
         Check for overlapping geometries beyond simple intersection points.
         :param tolerance: Minimum overlap area to consider
         """
         overlaps = []
-        gdf = gpd.GeoDataFrame(self.geometries, columns=['geometry', 'attributes'])
-        
-        for idx1, row1 in gdf.iterrows():
-            for idx2, row2 in gdf.iloc[idx1+1:].iterrows():
-                if row1['geometry'].overlaps(row2['geometry']):
-                    overlap_area = row1['geometry'].intersection(row2['geometry']).area
-                    if overlap_area > tolerance:
-                        # Debug print
-                        print(f"Found overlap: {type(row1['geometry'])}")
-                        
-                        # Convert geometries to GeoJSON format
-                        geom1_json = mapping(row1['geometry'])
-                        geom2_json = mapping(row2['geometry'])
-                        
-                        overlaps.append((
-                            geom1_json,
-                            geom2_json,
-                            row1['attributes'],
-                            row2['attributes']
-                        ))
+        geoms = self._geom_arr
+
+        left, right = self._candidate_pairs
+        overlapping = shapely.overlaps(geoms[left], geoms[right])
+        left, right = left[overlapping], right[overlapping]
+
+        overlap_areas = shapely.area(self._pairwise_intersection(left, right))
+        keep = overlap_areas > tolerance
+
+        for idx1, idx2 in zip(left[keep], right[keep]):
+            # Debug print
+            print(f"Found overlap: {type(geoms[idx1])}")
+
+            overlaps.append((
+                geoms[idx1],
+                geoms[idx2],
+                self._attributes(idx1),
+                self._attributes(idx2)
+            ))
         return overlaps
     
     def check_containment(self):
         """Check for geometries completely contained within others."""
         containment_issues = []
-        gdf = gpd.GeoDataFrame(self.geometries, columns=['geometry', 'attributes'])
-        
-        for idx1, row1 in gdf.iterrows():
-            for idx2, row2 in gdf.iloc[idx1+1:].iterrows():
-                if row1['geometry'].contains(row2['geometry']):
-                    containment_issues.append((row1['geometry'], row2['geometry'],
-                                            row1['attributes'], row2['attributes']))
+        geoms = self._geom_arr
+
+        # Test both directions on the shared pairs; equal geometries contain
+        # each other and are reported once
+        left, right = self._candidate_pairs
+        left_contains = shapely.contains(geoms[left], geoms[right])
+        right_contains = shapely.contains(geoms[right], geoms[left]) & ~left_contains
+        outer = np.concatenate([left[left_contains], right[right_contains]])
+        inner = np.concatenate([right[left_contains], left[right_contains]])
+
+        # Report pairs ordered by the containing feature
+        order = np.lexsort((inner, outer))
+        for idx1, idx2 in zip(outer[order], inner[order]):
+            containment_issues.append((geoms[idx1], geoms[idx2],
+                                    self._attributes(idx1), self._attributes(idx2)))
         return containment_issues
     
+    def _prepare_shared_state(self, checks):
+        """
+        Build the shared state the enabled checks need up front, so the checks
+        running in parallel threads only read these cached properties.
+        :param checks: Names of the enabled checks.
+        """
+        if 'intersections' in checks and self.invalid_intersections is None:
+            # Find intersections before the checks start in parallel: a cache hit
+            # skips building the candidate pairs, and the overlap check reuses the
+            # pair intersections memoized here instead of computing them concurrently
+            self.invalid_intersections = self._find_invalid_intersections()
+        if checks & {'overlaps', 'containment'}:
+            _ = self._candidate_pairs  # Also builds the spatial index
+        if checks & {'gaps', 'dangles'}:
+            _ = self._tree
+
     def validate_topology(self):
         """Run all enabled topology checks and return comprehensive results."""
-        results = {}
-        
-        if self.config.get('enabled_checks', {}).get('intersections', True):
-            results['intersections'] = self.check_intersections()
-        
-        if self.config.get('enabled_checks', {}).get('self_intersections', True):
-            results['self_intersections'] = self.check_self_intersections()
-        
-        if self.config.get('enabled_checks', {}).get('gaps', True):
-            gaps = self.check_gaps()
-            if gaps is not None:  # Changed this condition
-                results['gaps'] = gaps
-        
-        if self.config.get('enabled_checks', {}).get('dangles', True):
-            results['dangles'] = self.check_dangles()
-        
-        if self.config.get('enabled_checks', {}).get('overlaps', True):
-            results['overlaps'] = self.check_overlaps()
-        
-        if self.config.get('enabled_checks', {}).get('containment', True):
-            results['containment'] = self.check_containment()
+        if len(self._geom_arr) == 0:
+            return {}  # Nothing to check, skip building the index and pairs
+
+        enabled_checks = self.config.get('enabled_checks', {})
+        checks = {
+            'intersections': self.check_intersections,
+            'self_intersections': self.check_self_intersections,
+            'gaps': self.check_gaps,
+            'dangles': self.check_dangles,
+            'overlaps': self.check_overlaps,
+            'containment': self.check_containment
+        }
+        checks = {name: check for name, check in checks.items() if enabled_checks.get(name, True)}
+
+        self._prepare_shared_state(set(checks))
+
+        # Checks only read shared state and GEOS releases the GIL, so threads suffice
+        with ThreadPoolExecutor(max_workers=max(len(checks), 1)) as executor:
+            futures = {name: executor.submit(check) for name, check in checks.items()}
+            results = {name: future.result() for name, future in futures.items()}
         
         # Filter out empty results
         results = {k: v for k, v in results.items() if v is not None and (isinstance(v, list) and len(v) > 0 or not isinstance(v, list))}
@@ -364,14 +694,17 @@ class TopologyTest:
         """Generate a comprehensive summary report of all topology checks."""
         results = self.validate_topology()
         
-        report = f"Topology Summary for dataset: {self.dataset_type}\n"
-        report += f"Total geometries: {len(self.geometries)}\n\n"
+        lines = [
+            f"Topology Summary for dataset: {self.dataset_type}",
+            f"Total geometries: {len(self._geom_arr)}",
+            ""
+        ]
         
         for check_type, issues in results.items():
             if issues is not None:
-                report += f"{check_type.replace('_', ' ').title()}: {len(issues)} issues found\n"
+                lines.append(f"{check_type.replace('_', ' ').title()}: {len(issues)} issues found")
         
-        return report
+        return "\n".join(lines) + "\n"
     
     def _convert_to_json_serializable(self, obj):
         """Recursively convert Shapely geometries to GeoJSON format."""
@@ -386,6 +719,59 @@ class TopologyTest:
         else:
             return obj
     
+    def _issue_features(self, check_type, issues):
+        """
+        Yield GeoJSON features for pairwise issues, one serialized feature at a time.
+        :param check_type: 'intersections', 'overlaps' or 'containment'.
+        :param issues: The issue tuples returned by the matching check.
+        :return: Generator of GeoJSON feature strings.
+        """
+        if check_type == 'intersections':
+            # Serialize each geometry column in one GEOS call
+            geom1_json, geom2_json, inter_json = (
+                self._geometry_json([issue[i] for issue in issues]) for i in range(3))
+            for (_, _, _, attr1, attr2), g1, g2, inter in zip(
+                    issues, geom1_json, geom2_json, inter_json):
+                yield (f'{{"type": "Feature", "geometry": {inter}, "properties": {{'
+                       f'"feature1_attributes": {self._attributes_json(attr1)}, '
+                       f'"feature2_attributes": {self._attributes_json(attr2)}, '
+                       f'"feature1_geometry": {g1}, "feature2_geometry": {g2}}}}}')
+        elif check_type in ['overlaps', 'containment']:
+            geom1_json, geom2_json = (
+                self._geometry_json([issue[i] for issue in issues]) for i in range(2))
+            for (_, _, attr1, attr2), g1, g2 in zip(issues, geom1_json, geom2_json):
+                yield (f'{{"type": "Feature", "geometry": {g1}, "properties": {{'
+                       f'"feature1_attributes": {self._attributes_json(attr1)}, '
+                       f'"feature2_attributes": {self._attributes_json(attr2)}, '
+                       f'"feature2_geometry": {g2}}}}}')
+
+    def _geometry_json(self, geoms):
+        """
+        Serialize geometries to GeoJSON strings with a single vectorized call.
+        :param geoms: List of shapely geometries; GeoJSON dicts and None are also accepted.
+        :return: List of GeoJSON geometry strings.
+        """
+        arr = np.empty(len(geoms), dtype=object)
+        arr[:] = geoms
+        is_geom = shapely.is_geometry(arr)
+        result = arr.copy()
+        result[is_geom] = shapely.to_geojson(arr[is_geom])
+        result[~is_geom] = [self._dump_json(self._convert_to_json_serializable(g))
+                            for g in arr[~is_geom]]
+        return result.tolist()
+
+    def _attributes_json(self, attributes):
+        """Serialize a feature's attributes, leaving out any geometry entry."""
+        return self._dump_json(self._convert_to_json_serializable(
+            {k: v for k, v in attributes.items() if k != 'geometry'}))
+
+    def _dump_json(self, obj):
+        """Serialize an object to a compact JSON string, using orjson when available."""
+        if orjson:
+            return orjson.dumps(obj, option=(
+                orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)).decode()
+        return json.dumps(obj)
+
     def _save_issues_to_geojson(self, check_type, issues):
         try:
             print(f"\nSaving {check_type} issues:")
@@ -400,53 +786,28 @@ class TopologyTest:
             base_name = os.path.splitext(os.path.basename(self.geojson_file))[0]
             output_file = os.path.join(output_dir, f"{base_name}_{check_type}.geojson")
 
-            # Prepare features list based on check type
-            features = []
-            
-            if check_type == 'intersections':
-                for geom1, geom2, inter_geom, attr1, attr2 in issues:
-                    # Remove geometry from attributes if present
-                    attr1 = {k: v for k, v in attr1.items() if k != 'geometry'}
-                    attr2 = {k: v for k, v in attr2.items() if k != 'geometry'}
-                    
-                    properties = {
-                        'feature1_attributes': self._convert_to_json_serializable(attr1),
-                        'feature2_attributes': self._convert_to_json_serializable(attr2),
-                        'feature1_geometry': geom1,
-                        'feature2_geometry': geom2
-                    }
-                    features.append({
-                        'type': 'Feature',
-                        'geometry': inter_geom,
-                        'properties': properties
-                    })
-            elif check_type in ['overlaps', 'containment']:
-                for geom1, geom2, attr1, attr2 in issues:
-                    # Remove geometry from attributes if present
-                    attr1 = {k: v for k, v in attr1.items() if k != 'geometry'}
-                    attr2 = {k: v for k, v in attr2.items() if k != 'geometry'}
-                    
-                    properties = {
-                        'feature1_attributes': self._convert_to_json_serializable(attr1),
-                        'feature2_attributes': self._convert_to_json_serializable(attr2),
-                        'feature2_geometry': geom2
-                    }
-                    features.append({
-                        'type': 'Feature',
-                        'geometry': geom1,
-                        'properties': properties
-                    })
-
-            # Convert the entire feature collection to ensure everything is JSON serializable
-            feature_collection = {
-                'type': 'FeatureCollection',
-                'features': self._convert_to_json_serializable(features)
-            }
+            if check_type in ['self_intersections', 'dangles']:
+                # Single-feature issues have flat attributes, so GDAL can write them
+                # directly without building GeoJSON dicts in Python
+                geoms = [geom for geom, _ in issues]
+                attributes = [{k: v for k, v in attrs.items() if k != 'geometry'}
+                              for _, attrs in issues]
+                gdf = gpd.GeoDataFrame(attributes, geometry=geoms, crs=self.crs)
+
+                print(f"Saving to: {output_file}")
+                pyogrio.write_dataframe(gdf, output_file, driver="GeoJSON")
+                return output_file
 
             print(f"Saving to: {output_file}")
-            
-            with open(output_file, 'w') as f:
-                json.dump(feature_collection, f, indent=2)
+
+            # Stream the collection one feature at a time instead of building it in memory
+            with open(output_file, 'wb') as f:
+                f.write(b'{"type": "FeatureCollection", "features": [\n')
+                for i, feature in enumerate(self._issue_features(check_type, issues)):
+                    if i:
+                        f.write(b',\n')
+                    f.write(feature.encode())
+                f.write(b'\n]}\n')
 
             return output_file
         except Exception as e:
@@ -1,9 +1,32 @@
 import tkinter as tk
 from tkinter import ttk, filedialog
+import copy
 import json
 from TopologyTest import TopologyTest
 from pathlib import Path
 import os
+import stat
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import orjson  # Optional, faster JSON parsing
+except ImportError:
+    orjson = None
+
+def _run_one(path, dataset_type, config):
+    """
+    Run all topology checks for a single file; executed in a worker process.
+    :param path: Path to the GeoJSON file to validate.
+    :param dataset_type: The type of dataset, e.g., 'roads' or 'buildings'.
+    :param config: Parsed config dictionary shared by all files.
+    :return: A tuple of (summary report, dictionary of output files).
+    """
+    checker = TopologyTest(geojson_file=path, dataset_type=dataset_type, config=config)
+    results = checker.validate_topology()
+    output_files = checker.save_topology_results(results)
+    return checker.report_summary(), output_files
 
 class TopologyTestGUI:
     def __init__(self, root):
@@ -43,9 +66,9 @@ class TopologyTestGUI:
             
             print(f"Looking for config file at: {config_path}")  # Debug print
             
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                return config
+            with open(config_path, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if orjson else json.loads(data)
         except FileNotFoundError:
             print("Config file not found!")
             return {"global_settings": {"enabled_checks": {}, "tolerances": {}}, "dataset_rules": {}}
@@ -97,13 +120,16 @@ class TopologyTestGUI:
 
     def remove_file_row(self, row_frame):
         if len(self.file_rows) > 1:  # Keep at least one row
-            row_frame.grid_remove()
-            self.file_rows = [(f, p, t) for f, p, t in self.file_rows if f != row_frame]
-            self.reorder_rows()
+            row_frame.destroy()  # Free the widgets instead of just hiding them
+            index = next(i for i, (f, _, _) in enumerate(self.file_rows) if f is row_frame)
+            del self.file_rows[index]
+            self.reorder_rows(start=index)
 
-    def reorder_rows(self):
-        for i, (frame, _, _) in enumerate(self.file_rows):
+    def reorder_rows(self, start=0):
+        # Only rows from start onwards move; lay them out in a single idle pass
+        for i, (frame, _, _) in enumerate(self.file_rows[start:], start):
             frame.grid(row=i, column=0)
+        self.root.update_idletasks()
 
     def create_topology_checks_section(self, parent):
         # Topology Checks Frame
@@ -132,16 +158,27 @@ class TopologyTestGUI:
         # Get tolerances from config
         tolerances = self.config_file.get('global_settings', {}).get('tolerances', {})
         
-        # Create entry fields for each tolerance
+        # Create spinboxes for each tolerance; edits are validated as they are typed
         self.tolerance_vars = {}
         tolerances_list = [("gap", "Gap Tolerance"), ("overlap", "Overlap Tolerance")]
+        validate_command = (self.root.register(self.validate_tolerance), '%P')
         
         for i, (key, label) in enumerate(tolerances_list):
             ttk.Label(tolerance_frame, text=label).grid(row=i, column=0, padx=5, pady=5)
             var = tk.StringVar(value=str(tolerances.get(key, 0.001)))
             self.tolerance_vars[key] = var
-            ttk.Entry(tolerance_frame, textvariable=var, width=10).grid(
-                row=i, column=1, padx=5, pady=5)
+            ttk.Spinbox(tolerance_frame, textvariable=var, width=10, from_=0, to=1000,
+                        increment=0.001, validate='key',
+                        validatecommand=validate_command).grid(row=i, column=1, padx=5, pady=5)
+
+    def validate_tolerance(self, value):
+        """Accept only edits that leave the tolerance a non-negative number."""
+        if value in ("", "."):
+            return True  # Allow clearing the field and starting a decimal
+        try:
+            return float(value) >= 0
+        except ValueError:
+            return False
 
     def browse_file(self, path_var):
         filename = filedialog.askopenfilename(
@@ -153,20 +190,42 @@ class TopologyTestGUI:
         # Update config with current settings
         self.update_config()
         
-        # Run topology tests for each file
-        for _, path_var, type_var in self.file_rows:
-            if path_var.get() and type_var.get():
-                checker = TopologyTest(
-                    geojson_file=path_var.get(),
-                    dataset_type=type_var.get(),
-                    config_file='config.json'
-                )
-                
-                results = checker.validate_topology()
-                output_files = checker.save_topology_results(results)
-                
-                # Show results in a new window
-                self.show_results(checker.report_summary(), output_files)
+        # Files are independent, so run them in parallel worker processes
+        jobs = [(path_var.get(), type_var.get()) for _, path_var, type_var in self.file_rows
+                if path_var.get() and type_var.get()]
+        if not jobs:
+            return
+        
+        # Spawn rather than fork so workers never inherit the Tk interpreter state
+        executor = ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1),
+                                       mp_context=multiprocessing.get_context('spawn'))
+        # Jobs are pickled later on the executor's own threads, so hand them a
+        # snapshot that later settings changes cannot reach
+        config = copy.deepcopy(self.config_file)
+        futures = [executor.submit(_run_one, path, dataset_type, config)
+                   for path, dataset_type in jobs]
+        executor.shutdown(wait=False)  # Workers exit once the submitted files are done
+        
+        # Return to the Tk event loop right away and collect results as they finish
+        self.root.after(100, self.poll_results, futures)
+
+    def poll_results(self, futures):
+        """Show results of finished files and keep polling until all are done."""
+        pending = []
+        for future in futures:
+            if not future.done():
+                pending.append(future)
+                continue
+            try:
+                summary, output_files = future.result()
+            except Exception as e:
+                print(f"Error running topology tests: {str(e)}")
+                continue
+            # Show results in a new window
+            self.show_results(summary, output_files)
+        
+        if pending:
+            self.root.after(100, self.poll_results, pending)
 
     def update_config(self):
         # Update enabled checks
@@ -174,14 +233,27 @@ class TopologyTestGUI:
             check: var.get() for check, var in self.check_vars.items()
         }
         
-        # Update tolerances
-        self.config_file['global_settings']['tolerances'] = {
-            key: float(var.get()) for key, var in self.tolerance_vars.items()
-        }
+        # Update tolerances; a field left empty keeps its previous value
+        tolerances = self.config_file['global_settings'].get('tolerances', {})
+        for key, var in self.tolerance_vars.items():
+            try:
+                tolerances[key] = float(var.get())
+            except ValueError:
+                var.set(str(tolerances.get(key, 0.0)))
+        self.config_file['global_settings']['tolerances'] = tolerances
         
-        # Save updated config
-        with open('config.json', 'w') as f:
+        # Save updated config atomically so a failed write never leaves it truncated
+        config_dir = os.path.dirname(os.path.abspath('config.json'))
+        with tempfile.NamedTemporaryFile('w', dir=config_dir, suffix='.json',
+                                         delete=False) as f:
             json.dump(self.config_file, f, indent=4)
+        # Temporary files are private (0600); keep the permissions config.json had
+        try:
+            mode = stat.S_IMODE(os.stat('config.json').st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(f.name, mode)
+        os.replace(f.name, 'config.json')
 
 
     def show_results(self, summary, output_files):